@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+from gensim.models import Word2Vec
+
+from src.config import MODEL_FILE, PROCESSED_DATA_FILE
+from src.embed import pool_vectors, sif_weights
+
+N_TEXTS = 5000
+REPEATS = 3
+
+
+def naive_pool(wv, tokenized, pooling="mean", sif_a=1e-3):
+    """Reference implementation: one Python iteration per token."""
+    weights = sif_weights(wv, sif_a) if pooling == "sif" else None
+    embeddings = np.zeros((len(tokenized), wv.vector_size), dtype=np.float32)
+
+    for i, tokens in enumerate(tokenized):
+        count = 0
+        for token in tokens:
+            if token in wv.key_to_index:
+                index = wv.key_to_index[token]
+                weight = weights[index] if weights is not None else 1.0
+                embeddings[i] += weight * wv.vectors[index]
+                count += 1
+        if count:
+            embeddings[i] /= count
+
+    return embeddings
+
+
+def best_of(fn, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    print("Loading model:", MODEL_FILE)
+    wv = Word2Vec.load(str(MODEL_FILE)).wv
+
+    # The processed corpus is already tokenized: one sentence per line
+    with open(PROCESSED_DATA_FILE, encoding="utf-8") as f:
+        tokenized = [line.split() for _, line in zip(range(N_TEXTS), f)]
+
+    n_tokens = sum(len(tokens) for tokens in tokenized)
+    print(f"Benchmarking {len(tokenized)} sentences ({n_tokens} tokens)")
+
+    for pooling in ("mean", "sif"):
+        naive_time, expected = best_of(lambda: naive_pool(wv, tokenized, pooling))
+        fast_time, (actual, _) = best_of(lambda: pool_vectors(wv, tokenized, pooling))
+
+        assert np.allclose(expected, actual, atol=1e-4), "Pooling results differ"
+
+        print(
+            f"[{pooling}] naive loop: {naive_time * 1000:.1f} ms | "
+            f"vectorized: {fast_time * 1000:.1f} ms | "
+            f"speedup: {naive_time / fast_time:.1f}x | "
+            f"{len(tokenized) / fast_time:.0f} sentences/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Compare the server-side query endpoints against the client-side loops
+analysts used before (one /similarity or /similar call per pair / node).
+
+Start the API first:
+    uvicorn app.fastapi_app:app --port 8000
+
+Then run:
+    python -m analyze.benchmark_queries
+"""
+
+import argparse
+import time
+from itertools import combinations
+
+import requests
+
+WORDS = ["michael", "sonny", "fredo", "tom", "kay", "gun", "family", "don"]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def client_doesnt_match(session, url, words):
+    """O(n²) /similarity calls, then pick the word with the lowest mean."""
+    totals = {w: 0.0 for w in words}
+    for w1, w2 in combinations(words, 2):
+        score = session.get(f"{url}/similarity", params={"w1": w1, "w2": w2}).json()
+        totals[w1] += score["similarity"]
+        totals[w2] += score["similarity"]
+    return min(totals, key=totals.get), len(words) * (len(words) - 1) // 2
+
+
+def client_neighbourhood(session, url, seed, k, hops):
+    """One /similar call per node and hop."""
+    seen, frontier, calls = {seed}, [seed], 0
+    for _ in range(hops):
+        next_frontier = []
+        for word in frontier:
+            calls += 1
+            similar = session.get(f"{url}/similar/{word}", params={"topn": k}).json()
+            for item in similar:
+                if item["word"] not in seen:
+                    seen.add(item["word"])
+                    next_frontier.append(item["word"])
+        frontier = next_frontier
+    return len(seen), calls
+
+
+def report(name, client_time, client_calls, server_time):
+    print(
+        f"[{name}] client loop: {client_time * 1000:.1f} ms ({client_calls} calls) | "
+        f"server: {server_time * 1000:.1f} ms (1 call) | "
+        f"speedup: {client_time / server_time:.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--hops", type=int, default=2)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    words = [
+        w for w in WORDS if session.get(f"{args.url}/word-exists/{w}").json()["exists"]
+    ]
+    if len(words) < 2:
+        vocab = session.get(f"{args.url}/vocabulary", params={"sample_size": 6})
+        words = vocab.json()["sample_words"]
+
+    if not words:
+        raise SystemExit("The model vocabulary is empty.")
+
+    # --- Odd one out (needs at least two words) ---
+    if len(words) < 2:
+        print("[doesnt-match] skipped: fewer than two words in the vocabulary")
+    else:
+        client_time, (odd, calls) = timed(
+            lambda: client_doesnt_match(session, args.url, words)
+        )
+        server_time, response = timed(
+            lambda: session.get(
+                f"{args.url}/doesnt-match", params={"words": ",".join(words)}
+            ).json()
+        )
+        print(f"Odd one out: client={odd}, server={response['odd_one_out']}")
+        report("doesnt-match", client_time, calls, server_time)
+
+    # --- Neighbourhood graph ---
+    seed = words[0]
+    client_time, (n_nodes, calls) = timed(
+        lambda: client_neighbourhood(session, args.url, seed, args.k, args.hops)
+    )
+    server_time, response = timed(
+        lambda: session.get(
+            f"{args.url}/neighbourhood",
+            params={"words": seed, "k": args.k, "hops": args.hops},
+        ).json()
+    )
+    print(f"Neighbourhood nodes: client={n_nodes}, server={len(response['nodes'])}")
+    report("neighbourhood", client_time, calls, server_time)
+
+    # --- Nearest to vector (no client-side equivalent, server latency only) ---
+    vector = session.post(f"{args.url}/embed", json={"texts": [" ".join(words)]})
+    server_time, _ = timed(
+        lambda: session.post(
+            f"{args.url}/nearest", json={"vector": vector.json()["embeddings"][0]}
+        ).json()
+    )
+    print(f"[nearest] server: {server_time * 1000:.1f} ms (1 call)")
+
+
+if __name__ == "__main__":
+    main()
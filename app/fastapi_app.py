@@ -115,14 +115,15 @@ Enhanced FastAPI application for Word2Vec similarity API
 """
 
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query
 from pydantic import BaseModel, Field
-from gensim.models import Word2Vec
 
 
 import src.config as config
+from src.embed import embed_texts
+from src.registry import ModelRegistry
 
 # --- Response Models ---
 
@@ -147,13 +148,97 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status of the API")
 
     status: str
-    model_loaded: bool
+    model_loaded: bool = Field(..., description="Same as model_resident")
+    model_available: bool = Field(
+        ..., description="Default model is registered and its file exists"
+    )
+    model_resident: bool = Field(
+        ..., description="Default model is currently loaded in memory"
+    )
     vocabulary_size: Optional[int] = None
 
 
-# --- Global Variables to hold the model ---
+class ModelInfo(BaseModel):
+    name: str
+    version: str
+    path: str
+    loaded: bool
+    load_seconds: Optional[float] = Field(None, description="Load latency")
+    memory_bytes: Optional[int] = Field(None, description="Resident vector memory")
+    vocabulary_size: Optional[int] = None
+    hits: Optional[int] = None
+    last_used: Optional[float] = None
+
+
+class ModelsResponse(BaseModel):
+    default: str
+    budget_bytes: int
+    memory_bytes: int
+    evictions: int
+    models: List[ModelInfo]
+
+
+class EmbedRequest(BaseModel):
+    texts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=config.EMBED_MAX_TEXTS,
+        description=f"Raw sentences or documents (max {config.EMBED_MAX_TOKENS} "
+        "tokens each)",
+    )
+    pooling: Literal["mean", "sif"] = Field("mean", description="Pooling method")
+    sif_a: float = Field(1e-3, gt=0.0, description="SIF smoothing parameter")
+    remove_pc: bool = Field(
+        False,
+        description="Remove the model's common component, fitted once on the "
+        "vocabulary (SIF only)",
+    )
+
+
+class EmbedResponse(BaseModel):
+    pooling: str
+    dimension: int
+    token_counts: List[int] = Field(..., description="In-vocabulary tokens per text")
+    embeddings: List[List[float]]
+
+
+class ScoredWord(BaseModel):
+    word: str
+    score: float = Field(..., description="Cosine similarity (-1 to 1)")
+
+
+class DoesntMatchResponse(BaseModel):
+    odd_one_out: str
+    scores: List[ScoredWord] = Field(
+        ..., description="Similarity to the group centroid, least typical first"
+    )
+
 
-ml_models = {}
+class NearestRequest(BaseModel):
+    vector: List[float] = Field(..., min_length=1, description="Query vector")
+    topn: int = Field(10, ge=1, le=100)
+    exclude: List[str] = Field([], description="Words to leave out of the results")
+
+
+class NeighbourNode(BaseModel):
+    word: str
+    hop: int = Field(..., description="Hops from the nearest seed word")
+
+
+class NeighbourEdge(BaseModel):
+    source: str
+    target: str
+    score: float
+
+
+class NeighbourhoodResponse(BaseModel):
+    nodes: List[NeighbourNode]
+    edges: List[NeighbourEdge]
+
+
+# --- Global registry holding the models ---
+
+registry = ModelRegistry()
 
 
 @asynccontextmanager
@@ -161,25 +246,17 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan - load model on startup, cleanup on shutdown"""
 
     # --- Startup Logic ---
-    print("Loading model...")
-    if not config.MODEL_FILE.exists():
-        raise FileNotFoundError(
-            f"Model file not found at {config.MODEL_FILE}. Run training first."
-        )
-
-    # Load the full model
-    full_model = Word2Vec.load(str(config.MODEL_FILE))
-
-    # Store only the KeyedVectors (wv) in our dictionary for speed
-    ml_models["wv"] = full_model.wv
+    # Only the default model is loaded eagerly, the others on first request
+    print("Loading default model...")
+    entry = registry.get()
 
-    print(f"Model loaded successfully! Vocabulary size: {len(ml_models['wv'])}")
+    print(f"Model loaded successfully! Vocabulary size: {len(entry.wv)}")
 
     yield  # Control is passed to the application
 
     # --- Shutdown logic ---
     print("Cleaning up resources...")
-    ml_models.clear()
+    registry.clear()
 
     # Initialize the App with the lifespan manager
 
@@ -195,14 +272,41 @@ app = FastAPI(
 # --- Helper Functions ---
 
 
-def get_model():
-    """Get the loaded model, raise error if not available"""
-    model_wv = ml_models.get("wv")
-    if model_wv is None:
-        raise HTTPException(
-            status_code=503, detail="Model not loaded. Please try again later."
-        )
-    return model_wv
+def get_entry(
+    model: Optional[str] = Query(
+        None, description="Registered model, as 'name' or 'name@version'"
+    )
+):
+    """Get the requested model (loading it if needed), raise error if unavailable"""
+    try:
+        return registry.get(model)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+def get_model(entry=Depends(get_entry)):
+    """KeyedVectors of the requested model"""
+    return entry.wv
+
+
+def get_kernel(entry=Depends(get_entry)):
+    """Shared scoring kernel (normalized matrix) of the requested model"""
+    return registry.kernel(entry)
+
+
+def parse_words(words, kernel):
+    """Split a comma-separated list and check every word is in the vocabulary"""
+    parsed = [w.strip().lower() for w in words.split(",") if w.strip()]
+
+    for word in parsed:
+        if word not in kernel.wv:
+            raise HTTPException(
+                status_code=404, detail=f"Word '{word}' not in vocabulary."
+            )
+
+    return parsed
 
 
 # --- API Endpoints ---
@@ -220,7 +324,13 @@ def home():
             "similarity": "/similarity?w1=word1&w2=word2",
             "vocabulary": "/vocabulary",
             "analogy": "/analogy?positive=king,woman&negative=man",
+            "embed": "POST /embed",
+            "doesnt_match": "/doesnt-match?words=michael,sonny,fredo,gun",
+            "nearest": "POST /nearest",
+            "neighbourhood": "/neighbourhood?words=godfather&k=5&hops=2",
+            "models": "/models",
         },
+        "model_selection": "Add ?model=name or ?model=name@version to any query",
     }
 
 
@@ -230,7 +340,9 @@ def home():
     tags=["Word Similarity"],
 )
 def get_similar_words(
-    word: str, topn: int = Query(10, ge=1, le=50, description="Number of similar words")
+    word: str,
+    topn: int = Query(10, ge=1, le=50, description="Number of similar words"),
+    model_wv=Depends(get_model),
 ):
     """
     Returns top N similar words to the given word.
@@ -239,7 +351,6 @@ def get_similar_words(
     - **topn**: Number of similar words to return (1-50)
     """
     clean_word = word.lower().strip()
-    model_wv = get_model()
 
     if clean_word not in model_wv:
         raise HTTPException(
@@ -257,7 +368,7 @@ def get_similar_words(
     response_model=SimilarityResponse,
     tags=["Word Similarity"],
 )
-def get_similarity(w1: str, w2: str):
+def get_similarity(w1: str, w2: str, model_wv=Depends(get_model)):
     """
     Compare similarity between two words.
 
@@ -267,7 +378,6 @@ def get_similarity(w1: str, w2: str):
     Returns a similarity score between -1 and 1.
     """
     w1_clean, w2_clean = w1.lower().strip(), w2.lower().strip()
-    model_wv = get_model()
 
     if w1_clean not in model_wv:
         raise HTTPException(status_code=404, detail=f"Word '{w1}' not in vocabulary.")
@@ -280,14 +390,14 @@ def get_similarity(w1: str, w2: str):
 
 
 @app.get("/vocabulary", response_model=VocabResponse, tags=["General"])
-def get_vocabulary(sample_size: int = Query(20, ge=1, le=100)):
+def get_vocabulary(
+    sample_size: int = Query(20, ge=1, le=100), model_wv=Depends(get_model)
+):
     """
     Get vocabulary information.
 
     - **sample_size**: Number of sample words to return (1-100)
     """
-    model_wv = get_model()
-
     vocab = list(model_wv.index_to_key)
     sample = vocab[:sample_size]
 
@@ -299,6 +409,7 @@ def get_analogy(
     positive: str = Query(..., description="Comma-separated positive words"),
     negative: str = Query(..., description="Comma-separated negative words"),
     topn: int = Query(5, ge=1, le=20),
+    model_wv=Depends(get_model),
 ):
     """
     Solve word analogies. Example: king - man + woman = queen
@@ -307,8 +418,6 @@ def get_analogy(
     - **negative**: Words to subtract (comma-separated, e.g., "man")
     - **topn**: Number of results to return
     """
-    model_wv = get_model()
-
     # Parse inputs
     pos_words = [w.strip().lower() for w in positive.split(",") if w.strip()]
     neg_words = [w.strip().lower() for w in negative.split(",") if w.strip()]
@@ -336,11 +445,121 @@ def get_analogy(
         raise HTTPException(status_code=500, detail=f"Analogy computation failed: {e}")
 
 
+@app.post("/embed", response_model=EmbedResponse, tags=["Embeddings"])
+def embed(request: EmbedRequest, model_wv=Depends(get_model)):
+    """
+    Embed a batch of sentences / documents by pooling their word vectors.
+
+    - **texts**: Raw texts, tokenized the same way as the training corpus
+    - **pooling**: "mean" or "sif" (smooth inverse frequency weighting)
+    - **remove_pc**: Drop the model's common component from SIF embeddings
+
+    Texts without any in-vocabulary word get a zero vector.
+    """
+    try:
+        embeddings, token_counts = embed_texts(
+            model_wv,
+            request.texts,
+            pooling=request.pooling,
+            sif_a=request.sif_a,
+            remove_pc=request.remove_pc,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "pooling": request.pooling,
+        "dimension": model_wv.vector_size,
+        "token_counts": token_counts.tolist(),
+        "embeddings": embeddings.tolist(),
+    }
+
+
+@app.get(
+    "/doesnt-match", response_model=DoesntMatchResponse, tags=["Word Similarity"]
+)
+def doesnt_match(
+    words: str = Query(..., description="Comma-separated words (at least 2)"),
+    kernel=Depends(get_kernel),
+):
+    """
+    Find the word that fits the group least ("odd one out").
+
+    - **words**: Words to compare (comma-separated, e.g., "michael,sonny,gun")
+    """
+    parsed = parse_words(words, kernel)
+
+    if len(parsed) < 2:
+        raise HTTPException(status_code=400, detail="At least two words required.")
+
+    odd, ranked = kernel.doesnt_match(parsed)
+    return {
+        "odd_one_out": odd,
+        "scores": [{"word": w, "score": s} for w, s in ranked],
+    }
+
+
+@app.post("/nearest", response_model=List[ScoredWord], tags=["Word Similarity"])
+def nearest_to_vector(request: NearestRequest, kernel=Depends(get_kernel)):
+    """
+    Returns the words closest to an arbitrary vector
+    (e.g., an embedding from /embed or a client-side combination).
+
+    - **vector**: Query vector, same dimension as the model
+    - **topn**: Number of results to return
+    - **exclude**: Words to skip
+    """
+    exclude = [w.strip().lower() for w in request.exclude]
+    missing = [w for w in exclude if w not in kernel.wv]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Words {missing} not in vocabulary."
+        )
+
+    try:
+        results = kernel.nearest(request.vector, request.topn, exclude)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return [{"word": w, "score": s} for w, s in results]
+
+
+@app.get(
+    "/neighbourhood",
+    response_model=NeighbourhoodResponse,
+    tags=["Word Similarity"],
+)
+def get_neighbourhood(
+    words: str = Query(..., description="Comma-separated seed words"),
+    k: int = Query(5, ge=1, le=20, description="Neighbours per node"),
+    hops: int = Query(2, ge=1, le=3, description="Expansion depth"),
+    min_score: float = Query(0.0, ge=-1.0, le=1.0, description="Edge threshold"),
+    kernel=Depends(get_kernel),
+):
+    """
+    Expand the semantic neighbourhood graph around the seed words.
+
+    - **words**: Seed words (comma-separated)
+    - **k**: Nearest neighbours added per node and hop
+    - **hops**: How many times the graph is expanded (1-3)
+    - **min_score**: Drop edges below this similarity
+    """
+    parsed = parse_words(words, kernel)
+
+    if not parsed:
+        raise HTTPException(status_code=400, detail="At least one word required.")
+
+    nodes, edges = kernel.neighbourhood(parsed, k=k, hops=hops, min_score=min_score)
+    return {
+        "nodes": [{"word": w, "hop": hop} for w, hop in nodes],
+        "edges": [{"source": a, "target": b, "score": s} for a, b, s in edges],
+    }
+
+
 @app.get("/word-exists/{word}", tags=["General"])
-def check_word_exists(word: str):
+def check_word_exists(word: str, model_wv=Depends(get_model)):
     """Check if a word exists in the vocabulary"""
     clean_word = word.lower().strip()
-    model_wv = get_model()
 
     return {"word": word, "exists": clean_word in model_wv}
 
@@ -350,12 +569,28 @@ def health_check():
     """
     Health check endpoint — verifies API and model status.
     """
-    model_wv = ml_models.get("wv")
-    is_loaded = model_wv is not None
+    # The default model may have been evicted; it is reloaded on demand,
+    # so serving only needs it to resolve to an existing file
+    is_available = registry.available()
+    entry = registry.peek() if is_available else None
 
     return {
-        "status": "ok" if is_loaded else "model_not_loaded",
-        "model_loaded": is_loaded,
-        "vocabulary_size": len(model_wv) if is_loaded else None,
+        "status": "ok" if is_available else "model_not_loaded",
+        "model_loaded": entry is not None,
+        "model_available": is_available,
+        "model_resident": entry is not None,
+        "vocabulary_size": len(entry.wv) if entry is not None else None,
     }
 
+
+@app.get("/models", response_model=ModelsResponse, tags=["General"])
+def list_models():
+    """
+    List registered models with load latency and memory accounting.
+
+    Models are loaded lazily and evicted (least recently used first) once
+    the resident vectors exceed MODEL_MEMORY_BUDGET_MB. Eviction runs after
+    a load, so memory can briefly exceed the budget while a model is read
+    (about twice its size when no exported KeyedVectors file exists).
+    """
+    return registry.stats()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # 1. Get the Project Root folder dynamically
@@ -11,10 +12,38 @@ PROCESSED_DATA_DIR = DATA_DIR / "processed"
 MODELS_DIR = DATA_DIR / "models"
 
 # 3. Define File Names
-RAW_DATA_FILES = list(RAW_DATA_DIR.glob("*.pdf"))
+# (RAW_DATA_FILES is globbed lazily, see __getattr__ below)
 PROCESSED_DATA_FILE = PROCESSED_DATA_DIR / "godfather_corpus.txt"
+VOCAB_FILE = PROCESSED_DATA_DIR / "godfather_vocab.json"
 MODEL_FILE = MODELS_DIR / "godfather_w2v.model"
+KEYED_VECTORS_FILE = MODELS_DIR / "godfather_w2v.kv"
+INDEX_FILE = MODELS_DIR / "godfather_w2v_normed.npy"
+PCA_HTML_FILE = PROJ_ROOT / "analyze" / "pca_visual.html"
 
-# Create directories if they don't exist (safety check)
-PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-MODELS_DIR.mkdir(parents=True, exist_ok=True)
+# 4. Model Registry (serving)
+# Extra versions are discovered under data/models/<name>/<version>/*.model
+DEFAULT_MODEL = "godfather"
+MODEL_REGISTRY = {DEFAULT_MODEL: {"latest": MODEL_FILE}}
+MODEL_MEMORY_BUDGET_MB = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "1024"))
+
+# 5. Embedding endpoint limits
+EMBED_MAX_TEXTS = 10_000
+EMBED_MAX_TOKENS = 2_000  # per text
+EMBED_CHUNK_SIZE = 256  # texts pooled per sparse matrix product
+
+# 6. Pipeline
+# Stage hashes are stored here so up-to-date stages can be skipped
+PIPELINE_STATE_FILE = DATA_DIR / ".pipeline_state.json"
+
+
+def ensure_dirs():
+    """Create output directories if they don't exist (safety check)"""
+    PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    MODELS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def __getattr__(name):
+    # Only glob the raw PDFs when a stage actually asks for them
+    if name == "RAW_DATA_FILES":
+        return sorted(RAW_DATA_DIR.glob("*.pdf"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
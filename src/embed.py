@@ -0,0 +1,157 @@
+"""
+Sentence / document embeddings pooled from word vectors.
+
+Texts are tokenized with simple_preprocess (the same tokenizer used by
+preprocess.clean_tokenize) and pooled with a sparse matrix product:
+
+    pooled = W @ vectors
+
+where W is a (texts x vocab) matrix of per-token weights. This avoids a
+per-token Python loop. Texts are processed EMBED_CHUNK_SIZE at a time into
+a preallocated output, and each text is capped at EMBED_MAX_TOKENS tokens,
+so working memory is bounded by one chunk on top of the output matrix.
+"""
+
+import weakref
+from itertools import chain
+
+import numpy as np
+from gensim.utils import simple_preprocess
+from scipy import sparse
+
+import src.config as config
+
+POOLING_METHODS = ("mean", "sif")
+
+# Per-model caches, dropped together with the model when it is evicted
+_WORD_PROBS = weakref.WeakKeyDictionary()
+_COMMON_COMPONENTS = weakref.WeakKeyDictionary()
+
+
+def tokenize(texts):
+    """Lowercase + strip punctuation, matching clean_tokenize()."""
+    return [simple_preprocess(text.replace("\n", " ")) for text in texts]
+
+
+def word_probs(wv):
+    """
+    Unigram probabilities p(w) of the vocabulary, cached per model.
+
+    Uses the word counts stored by Word2Vec, falling back to a Zipf estimate
+    (vocabulary is sorted by frequency) when the counts are missing.
+    """
+    if wv not in _WORD_PROBS:
+        counts = wv.expandos.get("count") if hasattr(wv, "expandos") else None
+
+        if counts is None or not np.any(counts):
+            counts = 1.0 / np.arange(1, len(wv) + 1)
+
+        probs = np.asarray(counts, dtype=np.float64)
+        _WORD_PROBS[wv] = probs / probs.sum()
+
+    return _WORD_PROBS[wv]
+
+
+def sif_weights(wv, a=1e-3):
+    """
+    Smooth inverse frequency weights a / (a + p(w)).
+
+    Computed per call: a is client-supplied, so caching one array per value
+    would grow without bound outside the registry's memory budget.
+    """
+    return (a / (a + word_probs(wv))).astype(np.float32)
+
+
+def common_component(wv):
+    """
+    First principal direction of the corpus' word distribution, cached per
+    model: the top eigenvector of sum_w p(w) v_w v_w^T. Fitting it once on
+    the vocabulary (instead of on each request's batch) keeps a text's
+    embedding independent of the other texts it is sent with.
+    """
+    if wv not in _COMMON_COMPONENTS:
+        vectors = np.asarray(wv.vectors, dtype=np.float64)
+        moment = (vectors * word_probs(wv)[:, None]).T @ vectors
+        _, eigvecs = np.linalg.eigh(moment)
+        _COMMON_COMPONENTS[wv] = eigvecs[:, -1].astype(np.float32)
+    return _COMMON_COMPONENTS[wv]
+
+
+def pool_vectors(wv, tokenized, pooling="mean", sif_a=1e-3, remove_pc=False):
+    """
+    Pool each token list into one vector.
+
+    Returns (embeddings, token_counts) where token_counts is the number of
+    in-vocabulary tokens per text. Texts with no known tokens get zeros.
+    """
+    if pooling not in POOLING_METHODS:
+        raise ValueError(f"Unknown pooling '{pooling}', use one of {POOLING_METHODS}")
+
+    n_texts = len(tokenized)
+    lengths = np.fromiter((len(tokens) for tokens in tokenized), np.int64, n_texts)
+
+    # Flatten every token of the batch, look them up once, drop OOV tokens
+    key_to_index = wv.key_to_index
+    flat = chain.from_iterable(tokenized)
+    ids = np.fromiter((key_to_index.get(t, -1) for t in flat), np.int64)
+    rows = np.repeat(np.arange(n_texts), lengths)
+
+    known = ids >= 0
+    rows, cols = rows[known], ids[known]
+
+    if pooling == "sif":
+        probs = word_probs(wv)[cols]
+        data = (sif_a / (sif_a + probs)).astype(np.float32)
+    else:
+        data = np.ones(len(cols), dtype=np.float32)
+
+    # Duplicate (row, col) pairs are summed, so repeated tokens count twice
+    weights = sparse.csr_matrix((data, (rows, cols)), shape=(n_texts, len(wv)))
+    token_counts = np.bincount(rows, minlength=n_texts)
+
+    embeddings = np.asarray(weights @ wv.vectors, dtype=np.float32)
+    embeddings /= np.maximum(token_counts, 1)[:, None]
+
+    if pooling == "sif" and remove_pc:
+        # Zero rows (no known tokens) have no projection, so they stay zero
+        pc = common_component(wv)
+        embeddings -= np.outer(embeddings @ pc, pc)
+
+    return embeddings, token_counts
+
+
+def embed_texts(
+    wv,
+    texts,
+    pooling="mean",
+    sif_a=1e-3,
+    remove_pc=False,
+    chunk_size=None,
+    max_tokens=None,
+):
+    """
+    Tokenize raw texts and return their pooled embeddings, chunk by chunk.
+    Raises ValueError if a text has more than max_tokens tokens.
+    """
+    chunk_size = config.EMBED_CHUNK_SIZE if chunk_size is None else chunk_size
+    max_tokens = config.EMBED_MAX_TOKENS if max_tokens is None else max_tokens
+
+    embeddings = np.zeros((len(texts), wv.vector_size), dtype=np.float32)
+    token_counts = np.zeros(len(texts), dtype=np.int64)
+
+    for start in range(0, len(texts), chunk_size):
+        tokenized = tokenize(texts[start : start + chunk_size])
+
+        for offset, tokens in enumerate(tokenized):
+            if len(tokens) > max_tokens:
+                raise ValueError(
+                    f"Text {start + offset} has {len(tokens)} tokens, "
+                    f"the limit is {max_tokens}."
+                )
+
+        end = start + len(tokenized)
+        embeddings[start:end], token_counts[start:end] = pool_vectors(
+            wv, tokenized, pooling, sif_a, remove_pc
+        )
+
+    return embeddings, token_counts
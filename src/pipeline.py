@@ -0,0 +1,381 @@
+"""
+Single-pass pipeline runner.
+
+    preprocess -> vocab -> train -> export -> index
+                                 -> visualize
+
+Each stage declares its input and output files. A stage is skipped when the
+content hashes of its inputs (including its own source file) and outputs
+match the last successful run, independent stages run concurrently, and the
+state is saved after every stage so a failed run resumes where it stopped.
+
+Usage:
+    python -m src.pipeline                   # run everything that is stale
+    python -m src.pipeline train             # run train (and its upstream)
+    python -m src.pipeline --force train     # re-run train even if cached
+    python -m src.pipeline --force train,visualize visualize
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import mlflow
+import numpy as np
+from gensim.models import KeyedVectors, Word2Vec
+
+import src.config as config
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class Stage:
+    """One node of the pipeline DAG."""
+
+    def __init__(self, name, run, inputs=(), outputs=(), deps=()):
+        self.name = name
+        self.run = run
+        self._inputs = inputs
+        self.outputs = [Path(p) for p in outputs]
+        self.deps = list(deps)
+
+    @property
+    def inputs(self):
+        # Inputs may be a callable so globs are only evaluated when needed
+        inputs = self._inputs() if callable(self._inputs) else self._inputs
+        return [Path(p) for p in inputs]
+
+
+# --- Stage implementations ---
+# preprocess / train / visualize are imported lazily: importing them
+# downloads NLTK data or pulls in plotly + sklearn.
+
+
+def run_preprocess():
+    from src import preprocess
+
+    preprocess.main()
+
+
+def run_vocab():
+    from src.vocab import build_vocab
+
+    build_vocab(config.PROCESSED_DATA_FILE, config.VOCAB_FILE)
+
+
+def run_train():
+    from src.train import train_model
+
+    train_model(vocab_file=config.VOCAB_FILE)
+
+
+# export / index write to a temporary file and rename it into place: the API
+# may be reading (or memory-mapping) the previous file while the pipeline
+# runs, and rewriting it in place would truncate it under the reader.
+
+
+def run_export():
+    """Save only the KeyedVectors (no training state) for serving."""
+    wv = Word2Vec.load(str(config.MODEL_FILE)).wv
+
+    tmp_file = config.KEYED_VECTORS_FILE.with_suffix(".tmp")
+    wv.save(str(tmp_file), separately=[])  # one file, so one rename
+    tmp_file.replace(config.KEYED_VECTORS_FILE)
+
+
+def run_index():
+    """Precompute the L2-normalized vector matrix used for similarity search."""
+    wv = KeyedVectors.load(str(config.KEYED_VECTORS_FILE))
+
+    tmp_file = config.INDEX_FILE.with_suffix(".tmp")
+    with open(tmp_file, "wb") as f:
+        np.save(f, wv.get_normed_vectors().astype(np.float32))
+    tmp_file.replace(config.INDEX_FILE)
+
+
+def run_visualize():
+    from analyze import visualize_pca
+
+    visualize_pca.main(auto_open=False)
+
+
+def default_stages():
+    src_dir = config.PROJ_ROOT / "src"
+
+    return [
+        Stage(
+            "preprocess",
+            run_preprocess,
+            inputs=lambda: config.RAW_DATA_FILES + [src_dir / "preprocess.py"],
+            outputs=[config.PROCESSED_DATA_FILE],
+        ),
+        Stage(
+            "vocab",
+            run_vocab,
+            inputs=[config.PROCESSED_DATA_FILE, src_dir / "vocab.py"],
+            outputs=[config.VOCAB_FILE],
+            deps=["preprocess"],
+        ),
+        Stage(
+            "train",
+            run_train,
+            inputs=[
+                config.PROCESSED_DATA_FILE,
+                config.VOCAB_FILE,
+                src_dir / "train.py",
+            ],
+            outputs=[config.MODEL_FILE],
+            deps=["vocab"],
+        ),
+        Stage(
+            "export",
+            run_export,
+            inputs=[config.MODEL_FILE],
+            outputs=[config.KEYED_VECTORS_FILE],
+            deps=["train"],
+        ),
+        Stage(
+            "index",
+            run_index,
+            inputs=[config.KEYED_VECTORS_FILE],
+            outputs=[config.INDEX_FILE],
+            deps=["export"],
+        ),
+        Stage(
+            "visualize",
+            run_visualize,
+            inputs=[
+                config.MODEL_FILE,
+                config.PROJ_ROOT / "analyze" / "visualize_pca.py",
+            ],
+            outputs=[config.PCA_HTML_FILE],
+            deps=["train"],
+        ),
+    ]
+
+
+class Pipeline:
+    """Runs a DAG of stages with content-hash caching."""
+
+    def __init__(self, stages, state_file=None, max_workers=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_file = Path(state_file or config.PIPELINE_STATE_FILE)
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+
+        for stage in stages:
+            unknown = [dep for dep in stage.deps if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown {unknown}")
+
+    # --- State / hashing ---
+
+    def _load_state(self):
+        if self.state_file.exists():
+            with open(self.state_file, encoding="utf-8") as f:
+                return json.load(f)
+        return {"stages": {}, "files": {}}
+
+    def _save_state(self):
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, indent=2)
+            tmp_file.replace(self.state_file)
+
+    def file_hash(self, path):
+        """
+        MD5 of a file's content. Hashes are cached by (size, mtime) so
+        unchanged files are not re-read on every run.
+        """
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        cached = self.state["files"].get(str(path))
+
+        if cached and cached["signature"] == signature:
+            return cached["md5"]
+
+        md5 = hashlib.md5()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                md5.update(chunk)
+
+        digest = md5.hexdigest()
+        with self._lock:
+            self.state["files"][str(path)] = {"signature": signature, "md5": digest}
+        return digest
+
+    def fingerprint(self, stage):
+        """Hash of the stage name and the content of all of its inputs."""
+        md5 = hashlib.md5(stage.name.encode())
+        for path in sorted(stage.inputs):
+            md5.update(f"{path}:{self.file_hash(path)}".encode())
+        return md5.hexdigest()
+
+    def output_hashes(self, stage):
+        return {str(path): self.file_hash(path) for path in stage.outputs}
+
+    def is_up_to_date(self, stage, fingerprint):
+        record = self.state["stages"].get(stage.name)
+        if not record or record["fingerprint"] != fingerprint:
+            return False
+
+        if not all(path.exists() for path in stage.outputs):
+            return False
+
+        return record["outputs"] == self.output_hashes(stage)
+
+    # --- Execution ---
+
+    def _run_stage(self, stage, force):
+        start = time.perf_counter()
+        result = {"stage": stage.name, "status": "ran", "error": None}
+
+        try:
+            fingerprint = self.fingerprint(stage)
+
+            if not force and self.is_up_to_date(stage, fingerprint):
+                result["status"] = "skipped"
+            else:
+                print(f"▶ Running stage '{stage.name}'...")
+                stage.run()
+
+                missing = [str(p) for p in stage.outputs if not p.exists()]
+                if missing:
+                    raise FileNotFoundError(f"Stage did not produce {missing}")
+
+                record = {
+                    "fingerprint": fingerprint,
+                    "outputs": self.output_hashes(stage),
+                    "finished_at": time.time(),
+                }
+                with self._lock:
+                    self.state["stages"][stage.name] = record
+                self._save_state()
+
+        except Exception as e:
+            traceback.print_exc()
+            result["status"] = "failed"
+            result["error"] = str(e)
+
+        result["seconds"] = time.perf_counter() - start
+        print(f"■ {stage.name}: {result['status']} ({result['seconds']:.2f}s)")
+        return result
+
+    def _with_upstream(self, targets):
+        selected = set()
+        todo = list(targets)
+        while todo:
+            name = todo.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage '{name}'")
+            if name not in selected:
+                selected.add(name)
+                todo.extend(self.stages[name].deps)
+        return selected
+
+    def run(self, targets=None, force=()):
+        """
+        Run the selected stages (default: all) in dependency order.
+        Returns one report entry per stage, in completion order.
+        """
+        pending = self._with_upstream(targets or self.stages)
+        force = set(self.stages) if "all" in force else set(force)
+
+        report, done, running = [], set(), {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                ready = [
+                    name
+                    for name in sorted(pending)
+                    if all(dep in done for dep in self.stages[name].deps)
+                ]
+                for name in ready:
+                    pending.discard(name)
+                    future = pool.submit(
+                        self._run_stage, self.stages[name], name in force
+                    )
+                    running[future] = name
+
+                if not running:
+                    break  # everything left is blocked by a failed stage
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    del running[future]
+                    result = future.result()
+                    report.append(result)
+                    if result["status"] != "failed":
+                        done.add(result["stage"])
+
+        for name in sorted(pending):
+            report.append(
+                {"stage": name, "status": "blocked", "error": None, "seconds": 0.0}
+            )
+
+        self._save_state()
+        return report
+
+
+def print_report(report, total_seconds):
+    print("\nPipeline report")
+    print("-" * 40)
+    for result in report:
+        print(f"{result['stage']:<12} {result['status']:<8} {result['seconds']:>8.2f}s")
+    print("-" * 40)
+    print(f"{'total':<21} {total_seconds:>8.2f}s")
+
+
+def log_report(report, total_seconds):
+    """Log per-stage timings as one MLflow run."""
+    mlflow.set_experiment("Godfather_Word2Vec")
+
+    with mlflow.start_run(run_name="pipeline"):
+        for result in report:
+            mlflow.log_metric(f"{result['stage']}_seconds", result["seconds"])
+            mlflow.set_tag(f"{result['stage']}_status", result["status"])
+
+        mlflow.log_metric("pipeline_seconds", total_seconds)
+        mlflow.log_dict({"stages": report}, "pipeline_report.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Word2Vec pipeline")
+    parser.add_argument("stages", nargs="*", help="Target stages (default: all)")
+    parser.add_argument(
+        "--force",
+        action="append",
+        default=[],
+        help="Stage(s) to re-run even if cached, comma-separated or repeated; 'all'",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-mlflow", action="store_true")
+    args = parser.parse_args(argv)
+
+    pipeline = Pipeline(default_stages(), max_workers=args.workers)
+
+    start = time.perf_counter()
+    force = [name for value in args.force for name in value.split(",") if name]
+    report = pipeline.run(targets=args.stages, force=force)
+    total_seconds = time.perf_counter() - start
+
+    print_report(report, total_seconds)
+
+    if not args.no_mlflow:
+        log_report(report, total_seconds)
+
+    if any(result["status"] in ("failed", "blocked") for result in report):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
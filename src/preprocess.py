@@ -79,6 +79,7 @@ def main():
     # Saving to file with Progress
 
     print(f"Saving to {config.PROCESSED_DATA_FILE}...")
+    config.ensure_dirs()
 
     with open(config.PROCESSED_DATA_FILE, "w", encoding="utf-8") as f:
         for sentence in tqdm(all_sentences, desc="Writing sentences", leave=False):
@@ -0,0 +1,286 @@
+"""
+Registry of named / versioned Word2Vec models for the serving API.
+
+Models are loaded lazily on first use and kept in an LRU cache. When the
+resident models exceed the configured memory budget, the least recently
+used ones are evicted (the model being requested is never evicted).
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from gensim.models import KeyedVectors, Word2Vec
+
+import src.config as config
+from src.scoring import ScoringKernel, load_normed
+
+
+def discover_models(registry=None, models_dir=None):
+    """
+    Build the {name: {version: path}} mapping.
+
+    Starts from config.MODEL_REGISTRY and adds every
+    models_dir/<name>/<version>/*.model file (e.g. exported MLflow runs).
+    """
+    registry = config.MODEL_REGISTRY if registry is None else registry
+    models_dir = Path(config.MODELS_DIR if models_dir is None else models_dir)
+
+    entries = {name: dict(versions) for name, versions in registry.items()}
+
+    for model_file in sorted(models_dir.glob("*/*/*.model")):
+        version_dir = model_file.parent
+        name = version_dir.parent.name
+        entries.setdefault(name, {}).setdefault(version_dir.name, model_file)
+
+    return entries
+
+
+def version_sort_key(version, path):
+    """
+    Newest model file first (MLflow run ids are random hex, so names alone
+    carry no order), then natural order of the name so v10 > v9.
+    """
+    path = Path(path)
+    mtime = path.stat().st_mtime if path.exists() else float("-inf")
+    natural = [int(p) if p.isdigit() else p for p in re.split(r"(\d+)", version)]
+    return mtime, natural
+
+
+class LoadedModel:
+    """A resident model plus its load / usage accounting."""
+
+    def __init__(self, name, version, path, wv, load_seconds, index_file=None):
+        self.name = name
+        self.version = version
+        self.path = path
+        self.wv = wv
+        self.load_seconds = load_seconds
+        self.index_file = index_file
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+        self.hits = 0
+
+        # Built by ModelRegistry.kernel() so its memory is budgeted
+        self.kernel = None
+        self.kernel_lock = threading.Lock()
+
+    @property
+    def key(self):
+        return f"{self.name}@{self.version}"
+
+    @property
+    def memory_bytes(self):
+        """Bytes held by the vector matrix, cached norms and the kernel."""
+        total = self.wv.vectors.nbytes
+        norms = getattr(self.wv, "norms", None)
+        if norms is not None:
+            total += norms.nbytes
+        if self.kernel is not None:
+            total += self.kernel.memory_bytes
+        return total
+
+    def stats(self):
+        return {
+            "loaded": True,
+            "load_seconds": self.load_seconds,
+            "memory_bytes": self.memory_bytes,
+            "vocabulary_size": len(self.wv),
+            "hits": self.hits,
+            "last_used": self.last_used,
+        }
+
+
+class ModelRegistry:
+    """Lazy-loading, memory-bounded LRU cache of KeyedVectors."""
+
+    def __init__(
+        self, entries=None, budget_mb=None, default=None, indexes=None, exports=None
+    ):
+        self.entries = discover_models() if entries is None else entries
+        # model file -> KeyedVectors written by the pipeline's export stage
+        self.exports = {config.MODEL_FILE: config.KEYED_VECTORS_FILE}
+        self.exports.update(exports or {})
+        # model file -> normalized index written by the pipeline's index stage
+        self.indexes = {config.MODEL_FILE: config.INDEX_FILE}
+        self.indexes.update(indexes or {})
+        budget_mb = config.MODEL_MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.default = config.DEFAULT_MODEL if default is None else default
+
+        self._loaded = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}  # key -> lock held while that model is read from disk
+        self.evictions = 0
+
+    def resolve(self, spec=None):
+        """
+        Turn a model spec ("name", "name@version" or None) into
+        (name, version, path). Raises KeyError for unknown models.
+        """
+        spec = (spec or self.default).strip()
+        name, _, version = spec.partition("@")
+
+        versions = self.entries.get(name)
+        if not versions:
+            raise KeyError(f"Model '{name}' is not registered.")
+
+        if not version and "latest" in versions:
+            version = "latest"
+        elif not version:
+            version = max(versions, key=lambda v: version_sort_key(v, versions[v]))
+
+        if version not in versions:
+            raise KeyError(f"Model '{name}' has no version '{version}'.")
+
+        return name, version, Path(versions[version])
+
+    def get(self, spec=None):
+        """
+        Return the LoadedModel for spec, loading it on first use.
+
+        Only the cache lookup / insert runs under the registry lock; the
+        disk read holds a per-model lock, so requests for resident models
+        are never blocked by a cold load and a model is not loaded twice.
+        """
+        name, version, path = self.resolve(spec)
+        key = f"{name}@{version}"
+
+        with self._lock:
+            entry = self._loaded.get(key)
+            if entry is not None:
+                return self._touch(key, entry)
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another request may have finished loading it while we waited
+            with self._lock:
+                entry = self._loaded.get(key)
+                if entry is not None:
+                    return self._touch(key, entry)
+
+            try:
+                entry = self._load(name, version, path)
+            except Exception:
+                with self._lock:
+                    self._loading.pop(key, None)
+                raise
+
+            # Insert and release the load lock together, so no request can
+            # miss the cache in between and start a second load
+            with self._lock:
+                self._loaded[key] = entry
+                self._loading.pop(key, None)
+                self._evict()
+                return self._touch(key, entry)
+
+    def _load(self, name, version, path):
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Model file not found at {path}. Run training first."
+            )
+
+        # Prefer the exported KeyedVectors: Word2Vec.load() also reads the
+        # training state (syn1neg, ...), roughly doubling peak load memory
+        export_file = self.exports.get(path)
+        use_export = (
+            export_file is not None
+            and export_file.exists()
+            and export_file.stat().st_mtime >= path.stat().st_mtime
+        )
+        source = export_file if use_export else path
+
+        key = f"{name}@{version}"
+        print(f"Loading model {key} from {source}...")
+        start = time.perf_counter()
+        if use_export:
+            wv = KeyedVectors.load(str(source))
+        else:
+            wv = Word2Vec.load(str(path)).wv
+        load_seconds = time.perf_counter() - start
+        print(f"Loaded {key} in {load_seconds:.2f}s")
+
+        index_file = self.indexes.get(path)
+        return LoadedModel(name, version, path, wv, load_seconds, index_file)
+
+    def kernel(self, entry):
+        """
+        Return entry's ScoringKernel, building it on first use. The normalized
+        matrix counts against the memory budget, so eviction runs again once
+        it is attached.
+        """
+        with entry.kernel_lock:
+            if entry.kernel is None:
+                normed = load_normed(entry.wv, entry.index_file, entry.path)
+                kernel = ScoringKernel(entry.wv, normed)
+
+                with self._lock:
+                    entry.kernel = kernel
+                    key = entry.key
+                    if key in self._loaded:
+                        self._loaded.move_to_end(key)
+                    self._evict()
+
+        return entry.kernel
+
+    def _touch(self, key, entry):
+        """Mark entry as most recently used (registry lock must be held)."""
+        if key in self._loaded:
+            self._loaded.move_to_end(key)
+        entry.hits += 1
+        entry.last_used = time.time()
+        return entry
+
+    def _evict(self):
+        """
+        Drop least recently used models until we fit the budget.
+        The newest model sits at the end, so it is always kept.
+        """
+        while self.memory_bytes > self.budget_bytes and len(self._loaded) > 1:
+            key = next(iter(self._loaded))
+            print(f"Evicting model {key} (memory budget exceeded)")
+            del self._loaded[key]
+            self.evictions += 1
+
+    def available(self, spec=None):
+        """True if spec resolves to a model file that can be (re)loaded."""
+        try:
+            _, _, path = self.resolve(spec)
+        except KeyError:
+            return False
+        return path.exists()
+
+    def peek(self, spec=None):
+        """Return the resident LoadedModel (or None) without loading / LRU bump."""
+        name, version, _ = self.resolve(spec)
+        return self._loaded.get(f"{name}@{version}")
+
+    @property
+    def memory_bytes(self):
+        return sum(entry.memory_bytes for entry in self._loaded.values())
+
+    def stats(self):
+        """Per-model registry listing with load latency and memory usage."""
+        models = []
+
+        with self._lock:
+            for name, versions in sorted(self.entries.items()):
+                for version, path in sorted(versions.items()):
+                    entry = self._loaded.get(f"{name}@{version}")
+                    info = {"name": name, "version": version, "path": str(path)}
+                    info.update(entry.stats() if entry else {"loaded": False})
+                    models.append(info)
+
+            return {
+                "default": self.default,
+                "budget_bytes": self.budget_bytes,
+                "memory_bytes": self.memory_bytes,
+                "evictions": self.evictions,
+                "models": models,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._loaded.clear()
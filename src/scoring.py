@@ -0,0 +1,150 @@
+"""
+Vectorized scoring kernel shared by the server-side query endpoints.
+
+All queries are cosine similarities against the L2-normalized vector
+matrix, computed as one matrix product per batch of query vectors:
+
+    scores = queries @ normed.T
+
+doesnt_match, nearest and neighbourhood are thin layers on top of it.
+"""
+
+import numpy as np
+
+# Rows of the (queries x vocab) score matrix computed at once
+SCORE_BATCH_SIZE = 256
+
+
+def normalize(vectors):
+    """L2-normalize rows (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def load_normed(wv, index_file=None, model_file=None):
+    """
+    Return the normalized matrix, reusing the pipeline's precomputed index
+    (memory-mapped) when it is newer than the model and matches its shape.
+
+    Freshness is judged by mtime rather than the pipeline's content hashes:
+    the index stage always writes after train / export, and a model retrained
+    outside the pipeline gets a newer mtime. Hashing the model here would
+    mean reading the whole file again on every load.
+    """
+    fresh = index_file is not None and index_file.exists()
+    if fresh and model_file is not None and model_file.exists():
+        fresh = index_file.stat().st_mtime >= model_file.stat().st_mtime
+
+    if fresh:
+        normed = np.load(index_file, mmap_mode="r")
+        if normed.shape == wv.vectors.shape:
+            return normed
+
+    return normalize(wv.vectors)
+
+
+class ScoringKernel:
+    """Cosine scoring over one model's normalized vectors."""
+
+    def __init__(self, wv, normed=None):
+        self.wv = wv
+        self.normed = normalize(wv.vectors) if normed is None else normed
+
+    @property
+    def memory_bytes(self):
+        # Memory-mapped indexes count too: scoring touches every page
+        return self.normed.nbytes
+
+    def ids(self, words):
+        """Vocabulary indices of words. Raises KeyError for unknown words."""
+        return np.array([self.wv.key_to_index[w] for w in words], dtype=np.int64)
+
+    def score(self, queries):
+        """Yield (start, scores) for batches of the (queries x vocab) matrix."""
+        queries = np.atleast_2d(queries)
+        for start in range(0, len(queries), SCORE_BATCH_SIZE):
+            yield start, queries[start : start + SCORE_BATCH_SIZE] @ self.normed.T
+
+    @staticmethod
+    def top_k(scores, k, exclude=()):
+        """Indices and scores of the k best entries of a 1-D score row."""
+        scores = scores.copy()
+        if len(exclude):
+            scores[list(exclude)] = -np.inf
+
+        k = min(k, len(scores) - len(exclude))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return best, scores[best]
+
+    def nearest(self, vector, topn=10, exclude=()):
+        """Words closest to an arbitrary vector."""
+        if len(vector) != self.normed.shape[1]:
+            raise ValueError(
+                f"Vector has {len(vector)} dimensions, "
+                f"model expects {self.normed.shape[1]}."
+            )
+
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not np.isfinite(norm) or norm == 0:
+            raise ValueError("Vector must be finite and non-zero.")
+
+        _, scores = next(self.score(vector / norm))
+        exclude = np.unique(self.ids(exclude)) if len(exclude) else ()
+        best, best_scores = self.top_k(scores[0], topn, exclude)
+
+        return [(self.wv.index_to_key[i], float(s)) for i, s in zip(best, best_scores)]
+
+    def doesnt_match(self, words):
+        """
+        Score every word against the normalized mean of the group.
+        Returns (odd_word, [(word, score), ...]) sorted from least to most typical.
+        """
+        vectors = self.normed[self.ids(words)]
+        centroid = normalize(vectors.mean(axis=0))
+        scores = vectors @ centroid
+
+        order = np.argsort(scores)
+        ranked = [(words[i], float(scores[i])) for i in order]
+        return ranked[0][0], ranked
+
+    def neighbourhood(self, words, k=5, hops=2, min_score=0.0):
+        """
+        Expand a k-nearest-neighbour graph from the seed words.
+
+        Each hop scores the whole frontier in batched matrix products. Nodes
+        already reached are never expanded again, so a node's neighbours are
+        computed once per call even when several paths lead to it.
+        """
+        hop_of = {int(i): 0 for i in self.ids(words)}  # node id -> first hop
+        edges = []
+
+        frontier = list(hop_of)
+        for hop in range(1, hops + 1):
+            next_frontier = []
+
+            for start, scores in self.score(self.normed[frontier]):
+                for row, node in enumerate(frontier[start : start + len(scores)]):
+                    best, best_scores = self.top_k(scores[row], k, exclude=[node])
+
+                    for other, score in zip(best.tolist(), best_scores.tolist()):
+                        if score < min_score:
+                            break  # sorted, the rest scores lower
+                        edges.append((node, other, score))
+                        if other not in hop_of:
+                            hop_of[other] = hop
+                            next_frontier.append(other)
+
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        key = self.wv.index_to_key
+        nodes = [(key[i], hop) for i, hop in hop_of.items()]
+        edges = [(key[a], key[b], score) for a, b, score in edges]
+        return nodes, edges
@@ -1,26 +1,30 @@
+import json
+
 import mlflow
 from gensim.models import Word2Vec
 from gensim.models.word2vec import LineSentence
 
 import src.config as config
 
+# Define Hyperparamters (Moving them to variables makes them easier to log)
+
+PARAMS = {
+    "vector_size": 200,
+    "window": 7,
+    "min_count": 2,
+    "workers": 4,
+    "epochs": 10,
+}
+
 
-def train_model():
+def train_model(vocab_file=None):
     print("Initialize training...")
 
     # Set up mlflow experiment
 
     mlflow.set_experiment("Godfather_Word2Vec")
 
-    # Define Hyperparamters (Moving them to variables makes them easier to log)
-
-    params = {
-        "vector_size": 200,
-        "window": 7,
-        "min_count": 2,
-        "workers": 4,
-        "epochs": 10,
-    }
+    params = PARAMS
 
     # Check if data exists
     if not config.PROCESSED_DATA_FILE.exists():
@@ -40,19 +44,31 @@ def train_model():
 
         print("Training Word2Vec model...")
 
-        model = Word2Vec(
-            sentences=sentences,
-            vector_size=params["vector_size"],
-            window=params["window"],
-            min_count=params["min_count"],
-            workers=params["workers"],
-            epochs=params["epochs"],
-        )
+        if vocab_file is None:
+            model = Word2Vec(sentences=sentences, **params)
+        else:
+            # Vocabulary was counted by src.vocab.build_vocab(), only train here
+            with open(vocab_file, encoding="utf-8") as f:
+                vocab = json.load(f)
+
+            model = Word2Vec(**params)
+            model.build_vocab_from_freq(
+                vocab["counts"], corpus_count=vocab["corpus_count"]
+            )
+            # build_vocab_from_freq() leaves this at 0, Word2Vec.build_vocab() sets it;
+            # later model.train(total_words=...) calls rely on it
+            model.corpus_total_words = sum(vocab["counts"].values())
+            model.train(
+                sentences,
+                total_examples=model.corpus_count,
+                epochs=model.epochs,
+            )
 
         print("Training finished.")
 
         # Save the model
         print(f"Saving model to {config.MODEL_FILE}...")
+        config.ensure_dirs()
         model.save(str(config.MODEL_FILE))
 
         # Log the model file to MLflow
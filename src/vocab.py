@@ -0,0 +1,34 @@
+import json
+from collections import Counter
+
+from gensim.models.word2vec import LineSentence
+
+import src.config as config
+
+# Kept apart from train.py so changing hyperparameters there does not
+# invalidate the pipeline's cached vocabulary
+
+
+def build_vocab(corpus_file=None, vocab_file=None):
+    """
+    Count words of the processed corpus and save them as JSON,
+    so training can reuse the vocabulary instead of re-scanning the corpus.
+    """
+    corpus_file = config.PROCESSED_DATA_FILE if corpus_file is None else corpus_file
+    vocab_file = config.VOCAB_FILE if vocab_file is None else vocab_file
+
+    counts = Counter()
+    corpus_count = 0
+
+    for sentence in LineSentence(str(corpus_file)):
+        counts.update(sentence)
+        corpus_count += 1
+
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        json.dump({"corpus_count": corpus_count, "counts": counts}, f)
+
+    print(f"Saved {len(counts)} words from {corpus_count} sentences to {vocab_file}")
+
+
+if __name__ == "__main__":
+    build_vocab()